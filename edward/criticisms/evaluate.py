@@ -108,6 +108,8 @@ def evaluate(metrics, data, n_samples=500, output_key=None, seed=None):
   check_data(data)
   if not isinstance(n_samples, int):
     raise TypeError("n_samples must have type int.")
+  if n_samples < 1:
+    raise ValueError("n_samples must be a positive int.")
 
   if output_key is None:
     # Default output_key to the only data key that isn't a placeholder.
@@ -135,8 +137,8 @@ def evaluate(metrics, data, n_samples=500, output_key=None, seed=None):
     if isinstance(output_key, binary_discrete + categorical_discrete):
       # Average over realizations of their probabilities, then predict
       # via argmax over probabilities.
-      probs = [sess.run(output_key.probs, feed_dict) for _ in range(n_samples)]
-      probs = np.sum(probs, axis=0) / n_samples
+      probs = _mc_sum(sess, output_key.probs, feed_dict, n_samples)
+      probs = probs / n_samples
       if isinstance(output_key, binary_discrete):
         # make random prediction whenever probs is exactly 0.5
         random = tf.random_uniform(shape=tf.shape(probs))
@@ -154,9 +156,9 @@ def evaluate(metrics, data, n_samples=500, output_key=None, seed=None):
       probs = tf.constant(probs)
     else:
       # Monte Carlo estimate the mean of the posterior predictive.
-      y_pred = [sess.run(output_key, feed_dict) for _ in range(n_samples)]
-      y_pred = tf.cast(tf.add_n(y_pred), y_pred[0].dtype) / \
-          tf.cast(n_samples, y_pred[0].dtype)
+      y_pred = _mc_sum(sess, output_key, feed_dict, n_samples)
+      y_pred = tf.convert_to_tensor(y_pred) / \
+          tf.cast(n_samples, y_pred.dtype)
     if len(y_true.shape) == 0:
       y_true = tf.expand_dims(y_true, 0)
       y_pred = tf.expand_dims(y_pred, 0)
@@ -217,8 +219,9 @@ def evaluate(metrics, data, n_samples=500, output_key=None, seed=None):
     elif metric == 'log_lik' or metric == 'log_likelihood':
       # Monte Carlo estimate the log-density of the posterior predictive.
       tensor = tf.reduce_mean(output_key.log_prob(y_true))
-      log_pred = [sess.run(tensor, feed_dict) for _ in range(n_samples)]
-      log_pred = tf.add_n(log_pred) / tf.cast(n_samples, tensor.dtype)
+      log_pred = _mc_sum(sess, tensor, feed_dict, n_samples)
+      log_pred = tf.convert_to_tensor(log_pred) / \
+          tf.cast(n_samples, tensor.dtype)
       evaluations += [log_pred]
     elif callable(metric):
       evaluations += [metric(y_true, y_pred, **params)]
@@ -231,6 +234,34 @@ def evaluate(metrics, data, n_samples=500, output_key=None, seed=None):
     return sess.run(evaluations, feed_dict)
 
 
+def _mc_sum(sess, tensor, feed_dict, n_samples):
+  """Sum `n_samples` session runs of `tensor` in a single numpy
+  buffer, rather than keeping every sample in memory or embedding
+  each one in the graph as a constant.
+
+  Args:
+    sess: tf.Session.
+      Session used to run `tensor`.
+    tensor: tf.Tensor.
+      Tensor to draw samples of.
+    feed_dict: dict.
+      Feed dictionary passed to every session run.
+    n_samples: int.
+      Number of session runs to sum over. Must be positive.
+
+  Returns:
+    np.ndarray.
+    Array with the same shape and dtype as `tensor`; 0-d if `tensor`
+    is a scalar.
+  """
+  # Copy the first run so the in-place additions never write into an
+  # array owned by the session.
+  total = np.array(sess.run(tensor, feed_dict))
+  for _ in range(n_samples - 1):
+    total += sess.run(tensor, feed_dict)
+  return total
+
+
 # Classification metrics
 
 
@@ -126,7 +126,7 @@ def mvn_diag_log_prob(self, val):
   prec = tf.reciprocal(tf.square(scale_diag))
   result = prec * (-0.5 * tf.square(val) - 0.5 * tf.square(loc) +
                    val * loc)
-  result -= tf.log(scale_diag) + 0.5 * tf.log(2 * np.pi)
+  result -= tf.log(scale_diag) + 0.5 * np.log(2 * np.pi)
   return result
 
 
@@ -137,7 +137,7 @@ def normal_log_prob(self, val):
   prec = tf.reciprocal(tf.square(scale))
   result = prec * (-0.5 * tf.square(val) - 0.5 * tf.square(loc) +
                    val * loc)
-  result -= tf.log(scale) + 0.5 * tf.cast(tf.log(2 * np.pi), dtype=result.dtype)
+  result -= tf.log(scale) + 0.5 * np.log(2 * np.pi)
   return result
 
 
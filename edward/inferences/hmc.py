@@ -91,18 +91,19 @@ class HMC(MonteCarlo):
       old_r_sample[z] = tf.random_normal(event_shape, dtype=qz.dtype)
 
     # Simulate Hamiltonian dynamics.
-    new_sample, new_r_sample = leapfrog(old_sample, old_r_sample,
-                                        self.step_size,
-                                        self._log_joint_unconstrained,
-                                        self.n_steps)
+    new_sample, new_r_sample, old_log_joint, new_log_joint = leapfrog(
+        old_sample, old_r_sample, self.step_size,
+        self._log_joint_unconstrained, self.n_steps)
 
     # Calculate acceptance ratio.
     ratio = tf.reduce_sum([0.5 * tf.reduce_sum(tf.square(r))
                            for r in six.itervalues(old_r_sample)])
     ratio -= tf.reduce_sum([0.5 * tf.reduce_sum(tf.square(r))
                             for r in six.itervalues(new_r_sample)])
-    ratio += self._log_joint_unconstrained(new_sample)
-    ratio -= self._log_joint_unconstrained(old_sample)
+    # Reuse the log joints built by the integrator for its gradients
+    # rather than copying the model graph twice more.
+    ratio += new_log_joint
+    ratio -= old_log_joint
 
     # Accept or reject sample.
     u = tf.random_uniform([], dtype=ratio.dtype)
@@ -193,18 +194,42 @@ class HMC(MonteCarlo):
 
 
 def leapfrog(z_old, r_old, step_size, log_joint, n_steps):
+  """Simulate Hamiltonian dynamics with the leapfrog integrator.
+
+  Args:
+    z_old: OrderedDict.
+      Latent variable keys to initial positions.
+    r_old: OrderedDict.
+      Latent variable keys to initial momenta.
+    step_size: float.
+      Step size of the integrator.
+    log_joint: function.
+      Maps a dict of positions to the model's log joint density.
+    n_steps: int.
+      Number of leapfrog steps.
+
+  Returns:
+    tuple.
+    `(z_new, r_new, log_joint_old, log_joint_new)`: the final positions
+    and momenta, followed by the log joint evaluated at `z_old` and at
+    `z_new`. Both log joints are the tensors the integrator builds to
+    take gradients; if `n_steps` is 0 they are the same tensor.
+  """
   z_new = z_old.copy()
   r_new = r_old.copy()
 
-  grad_log_joint = tf.gradients(log_joint(z_new), list(six.itervalues(z_new)))
+  log_joint_old = log_joint(z_new)
+  log_joint_new = log_joint_old
+  grad_log_joint = tf.gradients(log_joint_old, list(six.itervalues(z_new)))
   for _ in range(n_steps):
     for i, key in enumerate(six.iterkeys(z_new)):
       z, r = z_new[key], r_new[key]
       r_new[key] = r + 0.5 * step_size * tf.convert_to_tensor(grad_log_joint[i])
       z_new[key] = z + step_size * r_new[key]
 
-    grad_log_joint = tf.gradients(log_joint(z_new), list(six.itervalues(z_new)))
+    log_joint_new = log_joint(z_new)
+    grad_log_joint = tf.gradients(log_joint_new, list(six.itervalues(z_new)))
     for i, key in enumerate(six.iterkeys(z_new)):
       r_new[key] += 0.5 * step_size * tf.convert_to_tensor(grad_log_joint[i])
 
-  return z_new, r_new
+  return z_new, r_new, log_joint_old, log_joint_new
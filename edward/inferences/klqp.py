@@ -135,12 +135,12 @@ class KLqp(VariationalInference):
     compute this automatically when $p(z)$ and $q(z; \lambda)$ are
     Normal.
     """
-    is_reparameterizable = all([
-        rv.reparameterization_type ==
+    is_reparameterizable = all(
+        qz.reparameterization_type ==
         tf.contrib.distributions.FULLY_REPARAMETERIZED
-        for rv in six.itervalues(self.latent_vars)])
-    is_analytic_kl = all([isinstance(z, Normal) and isinstance(qz, Normal)
-                          for z, qz in six.iteritems(self.latent_vars)])
+        for qz in six.itervalues(self.latent_vars))
+    is_analytic_kl = all(isinstance(z, Normal) and isinstance(qz, Normal)
+                         for z, qz in six.iteritems(self.latent_vars))
     if not is_analytic_kl and self.kl_scaling:
       raise TypeError("kl_scaling must be None when using non-analytic KL term")
     if is_reparameterizable:
@@ -651,8 +651,8 @@ def build_reparam_loss_and_gradients(inference, var_list):
   Computed by sampling from $q(z;\lambda)$ and evaluating the
   expectation using Monte Carlo sampling.
   """
-  p_log_prob = [0.0] * inference.n_samples
-  q_log_prob = [0.0] * inference.n_samples
+  p_log_prob = [[] for _ in range(inference.n_samples)]
+  q_log_prob = [[] for _ in range(inference.n_samples)]
   base_scope = tf.get_default_graph().unique_name("inference") + '/'
   for s in range(inference.n_samples):
     # Form dictionary in order to replace conditioning on prior or
@@ -671,21 +671,23 @@ def build_reparam_loss_and_gradients(inference, var_list):
       # Copy q(z) to obtain new set of posterior samples.
       qz_copy = copy(qz, scope=scope)
       dict_swap[z] = qz_copy.value()
-      q_log_prob[s] += tf.reduce_sum(
-          inference.scale.get(z, 1.0) * qz_copy.log_prob(dict_swap[z]))
+      q_log_prob[s].append(tf.reduce_sum(
+          inference.scale.get(z, 1.0) * qz_copy.log_prob(dict_swap[z])))
 
     for z in six.iterkeys(inference.latent_vars):
       z_copy = copy(z, dict_swap, scope=scope)
-      p_log_prob[s] += tf.reduce_sum(
-          inference.scale.get(z, 1.0) * z_copy.log_prob(dict_swap[z]))
+      p_log_prob[s].append(tf.reduce_sum(
+          inference.scale.get(z, 1.0) * z_copy.log_prob(dict_swap[z])))
 
     for x in six.iterkeys(inference.data):
       if isinstance(x, RandomVariable):
         x_copy = copy(x, dict_swap, scope=scope)
-        p_log_prob[s] += tf.reduce_sum(
-            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x]))
+        p_log_prob[s].append(tf.reduce_sum(
+            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x])))
 
+  p_log_prob = [_add_n(terms) for terms in p_log_prob]
   p_log_prob = tf.reduce_mean(p_log_prob)
+  q_log_prob = [_add_n(terms) for terms in q_log_prob]
   q_log_prob = tf.reduce_mean(q_log_prob)
   reg_penalty = tf.reduce_sum(tf.losses.get_regularization_losses())
 
@@ -720,7 +722,7 @@ def build_reparam_kl_loss_and_gradients(inference, var_list):
   Computed by sampling from $q(z;\lambda)$ and evaluating the
   expectation using Monte Carlo sampling.
   """
-  p_log_lik = [0.0] * inference.n_samples
+  p_log_lik = [[] for _ in range(inference.n_samples)]
   base_scope = tf.get_default_graph().unique_name("inference") + '/'
   for s in range(inference.n_samples):
     # Form dictionary in order to replace conditioning on prior or
@@ -743,12 +745,13 @@ def build_reparam_kl_loss_and_gradients(inference, var_list):
     for x in six.iterkeys(inference.data):
       if isinstance(x, RandomVariable):
         x_copy = copy(x, dict_swap, scope=scope)
-        p_log_lik[s] += tf.reduce_sum(
-            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x]))
+        p_log_lik[s].append(tf.reduce_sum(
+            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x])))
 
+  p_log_lik = [_add_n(terms) for terms in p_log_lik]
   p_log_lik = tf.reduce_mean(p_log_lik)
 
-  kl_penalty = tf.reduce_sum([
+  kl_penalty = _add_n([
       tf.reduce_sum(inference.kl_scaling.get(z, 1.0) * kl_divergence(qz, z))
       for z, qz in six.iteritems(inference.latent_vars)])
 
@@ -783,7 +786,7 @@ def build_reparam_entropy_loss_and_gradients(inference, var_list):
   Computed by sampling from $q(z;\lambda)$ and evaluating the
   expectation using Monte Carlo sampling.
   """
-  p_log_prob = [0.0] * inference.n_samples
+  p_log_prob = [[] for _ in range(inference.n_samples)]
   base_scope = tf.get_default_graph().unique_name("inference") + '/'
   for s in range(inference.n_samples):
     # Form dictionary in order to replace conditioning on prior or
@@ -805,18 +808,19 @@ def build_reparam_entropy_loss_and_gradients(inference, var_list):
 
     for z in six.iterkeys(inference.latent_vars):
       z_copy = copy(z, dict_swap, scope=scope)
-      p_log_prob[s] += tf.reduce_sum(
-          inference.scale.get(z, 1.0) * z_copy.log_prob(dict_swap[z]))
+      p_log_prob[s].append(tf.reduce_sum(
+          inference.scale.get(z, 1.0) * z_copy.log_prob(dict_swap[z])))
 
     for x in six.iterkeys(inference.data):
       if isinstance(x, RandomVariable):
         x_copy = copy(x, dict_swap, scope=scope)
-        p_log_prob[s] += tf.reduce_sum(
-            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x]))
+        p_log_prob[s].append(tf.reduce_sum(
+            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x])))
 
+  p_log_prob = [_add_n(terms) for terms in p_log_prob]
   p_log_prob = tf.reduce_mean(p_log_prob)
 
-  q_entropy = tf.reduce_sum([
+  q_entropy = _add_n([
       tf.reduce_sum(qz.entropy())
       for z, qz in six.iteritems(inference.latent_vars)])
 
@@ -844,8 +848,8 @@ def build_score_loss_and_gradients(inference, var_list):
   Computed by sampling from $q(z;\lambda)$ and evaluating the
   expectation using Monte Carlo sampling.
   """
-  p_log_prob = [0.0] * inference.n_samples
-  q_log_prob = [0.0] * inference.n_samples
+  p_log_prob = [[] for _ in range(inference.n_samples)]
+  q_log_prob = [[] for _ in range(inference.n_samples)]
   base_scope = tf.get_default_graph().unique_name("inference") + '/'
   for s in range(inference.n_samples):
     # Form dictionary in order to replace conditioning on prior or
@@ -864,22 +868,24 @@ def build_score_loss_and_gradients(inference, var_list):
       # Copy q(z) to obtain new set of posterior samples.
       qz_copy = copy(qz, scope=scope)
       dict_swap[z] = qz_copy.value()
-      q_log_prob[s] += tf.reduce_sum(
+      q_log_prob[s].append(tf.reduce_sum(
           inference.scale.get(z, 1.0) *
-          qz_copy.log_prob(tf.stop_gradient(dict_swap[z])))
+          qz_copy.log_prob(tf.stop_gradient(dict_swap[z]))))
 
     for z in six.iterkeys(inference.latent_vars):
       z_copy = copy(z, dict_swap, scope=scope)
-      p_log_prob[s] += tf.reduce_sum(
-          inference.scale.get(z, 1.0) * z_copy.log_prob(dict_swap[z]))
+      p_log_prob[s].append(tf.reduce_sum(
+          inference.scale.get(z, 1.0) * z_copy.log_prob(dict_swap[z])))
 
     for x in six.iterkeys(inference.data):
       if isinstance(x, RandomVariable):
         x_copy = copy(x, dict_swap, scope=scope)
-        p_log_prob[s] += tf.reduce_sum(
-            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x]))
+        p_log_prob[s].append(tf.reduce_sum(
+            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x])))
 
+  p_log_prob = [_add_n(terms) for terms in p_log_prob]
   p_log_prob = tf.stack(p_log_prob)
+  q_log_prob = [_add_n(terms) for terms in q_log_prob]
   q_log_prob = tf.stack(q_log_prob)
   reg_penalty = tf.reduce_sum(tf.losses.get_regularization_losses())
 
@@ -915,8 +921,8 @@ def build_score_kl_loss_and_gradients(inference, var_list):
   Computed by sampling from $q(z;\lambda)$ and evaluating the
   expectation using Monte Carlo sampling.
   """
-  p_log_lik = [0.0] * inference.n_samples
-  q_log_prob = [0.0] * inference.n_samples
+  p_log_lik = [[] for _ in range(inference.n_samples)]
+  q_log_prob = [[] for _ in range(inference.n_samples)]
   base_scope = tf.get_default_graph().unique_name("inference") + '/'
   for s in range(inference.n_samples):
     # Form dictionary in order to replace conditioning on prior or
@@ -935,20 +941,22 @@ def build_score_kl_loss_and_gradients(inference, var_list):
       # Copy q(z) to obtain new set of posterior samples.
       qz_copy = copy(qz, scope=scope)
       dict_swap[z] = qz_copy.value()
-      q_log_prob[s] += tf.reduce_sum(
+      q_log_prob[s].append(tf.reduce_sum(
           inference.scale.get(z, 1.0) *
-          qz_copy.log_prob(tf.stop_gradient(dict_swap[z])))
+          qz_copy.log_prob(tf.stop_gradient(dict_swap[z]))))
 
     for x in six.iterkeys(inference.data):
       if isinstance(x, RandomVariable):
         x_copy = copy(x, dict_swap, scope=scope)
-        p_log_lik[s] += tf.reduce_sum(
-            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x]))
+        p_log_lik[s].append(tf.reduce_sum(
+            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x])))
 
+  p_log_lik = [_add_n(terms) for terms in p_log_lik]
   p_log_lik = tf.stack(p_log_lik)
+  q_log_prob = [_add_n(terms) for terms in q_log_prob]
   q_log_prob = tf.stack(q_log_prob)
 
-  kl_penalty = tf.reduce_sum([
+  kl_penalty = _add_n([
       tf.reduce_sum(inference.kl_scaling.get(z, 1.0) * kl_divergence(qz, z))
       for z, qz in six.iteritems(inference.latent_vars)])
 
@@ -986,8 +994,8 @@ def build_score_entropy_loss_and_gradients(inference, var_list):
   Computed by sampling from $q(z;\lambda)$ and evaluating the
   expectation using Monte Carlo sampling.
   """
-  p_log_prob = [0.0] * inference.n_samples
-  q_log_prob = [0.0] * inference.n_samples
+  p_log_prob = [[] for _ in range(inference.n_samples)]
+  q_log_prob = [[] for _ in range(inference.n_samples)]
   base_scope = tf.get_default_graph().unique_name("inference") + '/'
   for s in range(inference.n_samples):
     # Form dictionary in order to replace conditioning on prior or
@@ -1006,25 +1014,27 @@ def build_score_entropy_loss_and_gradients(inference, var_list):
       # Copy q(z) to obtain new set of posterior samples.
       qz_copy = copy(qz, scope=scope)
       dict_swap[z] = qz_copy.value()
-      q_log_prob[s] += tf.reduce_sum(
+      q_log_prob[s].append(tf.reduce_sum(
           inference.scale.get(z, 1.0) *
-          qz_copy.log_prob(tf.stop_gradient(dict_swap[z])))
+          qz_copy.log_prob(tf.stop_gradient(dict_swap[z]))))
 
     for z in six.iterkeys(inference.latent_vars):
       z_copy = copy(z, dict_swap, scope=scope)
-      p_log_prob[s] += tf.reduce_sum(
-          inference.scale.get(z, 1.0) * z_copy.log_prob(dict_swap[z]))
+      p_log_prob[s].append(tf.reduce_sum(
+          inference.scale.get(z, 1.0) * z_copy.log_prob(dict_swap[z])))
 
     for x in six.iterkeys(inference.data):
       if isinstance(x, RandomVariable):
         x_copy = copy(x, dict_swap, scope=scope)
-        p_log_prob[s] += tf.reduce_sum(
-            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x]))
+        p_log_prob[s].append(tf.reduce_sum(
+            inference.scale.get(x, 1.0) * x_copy.log_prob(dict_swap[x])))
 
+  p_log_prob = [_add_n(terms) for terms in p_log_prob]
   p_log_prob = tf.stack(p_log_prob)
+  q_log_prob = [_add_n(terms) for terms in q_log_prob]
   q_log_prob = tf.stack(q_log_prob)
 
-  q_entropy = tf.reduce_sum([
+  q_entropy = _add_n([
       tf.reduce_sum(qz.entropy())
       for z, qz in six.iteritems(inference.latent_vars)])
 
@@ -1125,8 +1135,8 @@ def build_score_rb_loss_and_gradients(inference, var_list):
     pi_log_prob = [0.0] * inference.n_samples
     qi_log_prob = [0.0] * inference.n_samples
     for s in range(inference.n_samples):
-      pi_log_prob[s] = tf.reduce_sum([p_log_probs[s][rv] for rv in var_p_rvs])
-      qi_log_prob[s] = tf.reduce_sum([q_log_probs[s][rv] for rv in var_q_rvs])
+      pi_log_prob[s] = _add_n([p_log_probs[s][rv] for rv in var_p_rvs])
+      qi_log_prob[s] = _add_n([q_log_probs[s][rv] for rv in var_q_rvs])
 
     pi_log_prob = tf.stack(pi_log_prob)
     qi_log_prob = tf.stack(qi_log_prob)
@@ -1150,3 +1160,14 @@ def build_score_rb_loss_and_gradients(inference, var_list):
   grads_vars.extend(model_vars)
   grads_and_vars = list(zip(grads, grads_vars))
   return loss, grads_and_vars
+
+
+def _add_n(terms):
+  """Sum a list of scalar tensors with a single `tf.add_n` op rather
+  than a chain of pairwise additions or a stack followed by a
+  reduction. A single tensor is returned as is, and 0.0 if the list is
+  empty.
+  """
+  if not terms:
+    return 0.0
+  return tf.add_n(terms)
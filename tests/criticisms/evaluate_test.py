@@ -6,6 +6,7 @@ import edward as ed
 import numpy as np
 import tensorflow as tf
 
+from edward.criticisms.evaluate import _mc_sum
 from edward.models import Bernoulli, Categorical, Multinomial, Normal
 
 
@@ -150,6 +151,39 @@ class test_evaluate_class(tf.test.TestCase):
       ed.evaluate('mean_squared_error', {x: x_data}, n_samples=5)
       self.assertRaises(TypeError, ed.evaluate, 'mean_squared_error',
                         {x: x_data}, n_samples='1')
+      self.assertRaises(ValueError, ed.evaluate, 'mean_squared_error',
+                        {x: x_data}, n_samples=0)
+      self.assertRaises(ValueError, ed.evaluate, 'log_lik',
+                        {x: x_data}, n_samples=-1)
+
+  def test_mc_sum(self):
+    with self.test_session() as sess:
+      scalar = tf.constant(2.0)
+      total = _mc_sum(sess, scalar, {}, 1)
+      self.assertEqual(total.shape, ())
+      self.assertAllClose(total, 2.0)
+      self.assertAllClose(_mc_sum(sess, scalar, {}, 3), 6.0)
+      vector = tf.constant([1, 2])
+      total = _mc_sum(sess, vector, {}, 1)
+      self.assertEqual(total.dtype, np.int32)
+      self.assertAllEqual(total, [1, 2])
+      self.assertAllEqual(_mc_sum(sess, vector, {}, 3), [3, 6])
+
+  def test_n_samples_scalar_output(self):
+    with self.test_session():
+      x = Normal(loc=0.0, scale=1.0)
+      x_data = tf.constant(0.0)
+      for n_samples in [1, 5]:
+        self.assertAllClose(
+            -0.5 * np.log(2 * np.pi),
+            ed.evaluate('log_lik', {x: x_data}, n_samples=n_samples))
+        ed.evaluate('mean_squared_error', {x: x_data}, n_samples=n_samples)
+      x = Bernoulli(probs=0.51)
+      x_data = tf.constant(1)
+      for n_samples in [1, 5]:
+        self.assertAllClose(
+            1.0,
+            ed.evaluate('binary_accuracy', {x: x_data}, n_samples=n_samples))
 
   def test_output_key(self):
     with self.test_session():
@@ -6,6 +6,8 @@ import edward as ed
 import numpy as np
 import tensorflow as tf
 
+from collections import OrderedDict
+from edward.inferences.hmc import leapfrog
 from edward.models import Categorical, Empirical, Normal
 
 
@@ -122,6 +124,27 @@ class test_hmc_class(tf.test.TestCase):
       inference = ed.HMC({mu: qmu}, data={x: x_data})
       inference.initialize()
 
+  def test_leapfrog(self):
+    with self.test_session() as sess:
+      def log_joint(z_sample):
+        return tf.reduce_sum(Normal(0.0, 1.0).log_prob(z_sample['z']))
+
+      z_old = OrderedDict([('z', tf.constant([0.5, -1.0]))])
+      r_old = OrderedDict([('z', tf.constant([1.0, 0.3]))])
+
+      z_new, _, log_joint_old, log_joint_new = leapfrog(
+          z_old, r_old, 0.1, log_joint, 3)
+      val_old, val_new, expected_old, expected_new = sess.run(
+          [log_joint_old, log_joint_new, log_joint(z_old), log_joint(z_new)])
+      self.assertAllClose(val_old, expected_old)
+      self.assertAllClose(val_new, expected_new)
+      self.assertNotAlmostEqual(val_old, val_new)
+
+      _, _, log_joint_old, log_joint_new = leapfrog(
+          z_old, r_old, 0.1, log_joint, 0)
+      self.assertIs(log_joint_old, log_joint_new)
+      self.assertAllClose(log_joint_old.eval(), expected_old)
+
 if __name__ == '__main__':
   ed.set_seed(42)
   tf.test.main()